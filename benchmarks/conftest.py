@@ -0,0 +1,67 @@
+# Fixtures shared by the benchmarks.
+#
+# Apart from `test_compilation_time.py`, the benchmarks measure what
+# happens after compilation: `compiled` holds one module per compiler
+# and engine pair, and `module` one for the default store.
+
+from wasmer import engine, Store, Module
+import importlib
+import itertools
+import os
+import pytest
+
+here = os.path.dirname(os.path.realpath(__file__))
+
+# Not every compiler is built on every platform (see the `build`
+# recipe of the `justfile`), so only the installed ones are
+# benchmarked.
+COMPILERS = {}
+
+for compiler_name in ('cranelift', 'llvm', 'singlepass'):
+    try:
+        COMPILERS[compiler_name] = importlib.import_module('wasmer_compiler_' + compiler_name).Compiler
+    except ImportError:
+        pass
+
+ENGINES = {'jit': engine.JIT, 'native': engine.Native}
+
+@pytest.fixture(scope='session')
+def wasm_bytes():
+    """Returns the bytes of the benchmarked Wasm module, read once."""
+
+    with open(here + '/../tests/tests.wasm', 'rb') as file:
+        return file.read()
+
+@pytest.fixture(scope='session')
+def module(wasm_bytes):
+    """Returns the benchmarked module compiled with the default store,
+    for the benchmarks that do not depend on the compiler or the
+    engine."""
+
+    return Module(Store(), wasm_bytes)
+
+@pytest.fixture(scope='session', params=itertools.product(COMPILERS, ENGINES), ids='-'.join)
+def compiler_and_engine(request):
+    """Returns each `(compiler, engine)` pair of names in turn."""
+
+    return request.param
+
+@pytest.fixture(scope='session')
+def compiled(compiler_and_engine, wasm_bytes):
+    """Returns a `(store, module, serialized_module)` triple for each
+    compiler and engine pair."""
+
+    compiler, engine_ = compiler_and_engine
+    store = Store(ENGINES[engine_](COMPILERS[compiler]))
+    module = Module(store, wasm_bytes)
+
+    return store, module, module.serialize()
+
+@pytest.fixture(scope='session')
+def headless_store(compiler_and_engine):
+    """Returns a store whose engine has no compiler, as used to run
+    modules that have been compiled ahead of time."""
+
+    _, engine_ = compiler_and_engine
+
+    return Store(ENGINES[engine_]())
@@ -0,0 +1,17 @@
+from wasmer import Module
+
+def test_benchmark_compilation_time(benchmark, compiled, wasm_bytes):
+    store, _, _ = compiled
+
+    def bench():
+        _ = Module(store, wasm_bytes)
+
+    benchmark(bench)
+
+def test_benchmark_load_time_cached(benchmark, compiled):
+    store, _, serialized_module = compiled
+
+    def bench():
+        _ = Module.deserialize(store, serialized_module)
+
+    benchmark(bench)
@@ -0,0 +1,40 @@
+from wasmer import Instance
+
+def test_benchmark_execution_time(benchmark, compiled):
+    _, module, _ = compiled
+    sum = Instance(module).exports.sum
+
+    # Bind everything as default arguments so that the loop only
+    # executes `LOAD_FAST` before calling the function.
+    def bench(sum=sum, x=1, y=2):
+        _ = sum(x, y)
+
+    benchmark(bench)
+
+def test_benchmark_execution_time_without_arguments(benchmark, compiled):
+    _, module, _ = compiled
+    arity_0 = Instance(module).exports.arity_0
+
+    # No argument to convert: compared to the benchmark above, this
+    # isolates the cost of the call from the cost of the conversions.
+    def bench(arity_0=arity_0):
+        _ = arity_0()
+
+    benchmark(bench)
+
+def test_benchmark_instantiate_only(benchmark, compiled):
+    _, module, _ = compiled
+
+    def bench(module=module):
+        _ = Instance(module)
+
+    benchmark(bench)
+
+def test_benchmark_instantiate_and_call(benchmark, compiled):
+    _, module, _ = compiled
+
+    # A fresh instance per call, as a host would do per request.
+    def bench(module=module, x=1, y=2):
+        _ = Instance(module).exports.sum(x, y)
+
+    benchmark(bench)
@@ -0,0 +1,31 @@
+from wasmer import Module, Instance
+
+# A headless engine cannot compile: it only loads serialized modules
+# and instantiates them. Each step is measured separately, and then
+# together.
+
+def test_benchmark_headless_time_deserialize_only(benchmark, compiled, headless_store):
+    _, _, serialized_module = compiled
+
+    def bench():
+        _ = Module.deserialize(headless_store, serialized_module)
+
+    benchmark(bench)
+
+def test_benchmark_headless_time_instantiate_only(benchmark, compiled, headless_store):
+    _, _, serialized_module = compiled
+    module = Module.deserialize(headless_store, serialized_module)
+
+    def bench():
+        _ = Instance(module)
+
+    benchmark(bench)
+
+def test_benchmark_headless_time_full(benchmark, compiled, headless_store):
+    _, _, serialized_module = compiled
+
+    def bench():
+        module = Module.deserialize(headless_store, serialized_module)
+        _ = Instance(module)
+
+    benchmark(bench)
@@ -0,0 +1,60 @@
+from wasmer import Instance
+import pytest
+import struct
+
+SIZES = [1, 64, 4096, 65536]
+
+@pytest.fixture
+def memory(module):
+    return Instance(module).exports.memory
+
+def test_benchmark_memory_view_int8_get(benchmark, memory):
+    int8 = memory.int8_view()
+
+    def bench(int8=int8):
+        _ = int8[0]
+
+    benchmark(bench)
+
+@pytest.mark.parametrize('size', SIZES)
+def test_benchmark_memory_view_int8_bulk_get(benchmark, memory, size):
+    int8 = memory.int8_view()
+
+    def bench(int8=int8, size=size):
+        _ = int8[0:size]
+
+    benchmark(bench)
+
+def test_benchmark_memory_buffer_get(benchmark, memory):
+    buffer = memoryview(memory.buffer)
+
+    def bench(buffer=buffer):
+        _ = buffer[0]
+
+    benchmark(bench)
+
+def test_benchmark_memory_buffer_cast_get(benchmark, memory):
+    buffer = memoryview(memory.buffer).cast('B')
+
+    def bench(buffer=buffer):
+        _ = buffer[0]
+
+    benchmark(bench)
+
+def test_benchmark_memory_buffer_struct_unpack_get(benchmark, memory):
+    buffer = memoryview(memory.buffer)
+    unpack_from = struct.Struct('B').unpack_from
+
+    def bench(unpack_from=unpack_from, buffer=buffer):
+        _ = unpack_from(buffer, 0)[0]
+
+    benchmark(bench)
+
+@pytest.mark.parametrize('size', SIZES)
+def test_benchmark_memory_buffer_tobytes(benchmark, memory, size):
+    buffer = memoryview(memory.buffer)[0:size]
+
+    def bench(buffer=buffer):
+        _ = buffer.tobytes()
+
+    benchmark(bench)
@@ -0,0 +1,51 @@
+from wasmer import Instance
+import array
+import pytest
+
+PAYLOAD = bytes(range(0, 255))
+PAYLOAD_ARRAY = array.array('B', PAYLOAD)
+
+@pytest.fixture
+def uint8_view(module):
+    return Instance(module).exports.memory.uint8_view()
+
+def test_benchmark_memory_view_set_value(benchmark, uint8_view):
+    memory = uint8_view
+
+    def bench(memory=memory):
+        memory[0] = 42
+
+    benchmark(bench)
+
+def test_benchmark_memory_view_set_sequence_with_a_loop(benchmark, uint8_view):
+    memory = uint8_view
+
+    def bench(memory=memory):
+        for nth in range(0, 255):
+            memory[nth] = nth
+
+    benchmark(bench)
+
+def test_benchmark_memory_view_set_sequence_with_slice_assignment(benchmark, uint8_view):
+    memory = uint8_view
+
+    def bench(memory=memory, payload=PAYLOAD):
+        memory[0:255] = payload
+
+    benchmark(bench)
+
+def test_benchmark_memory_view_set_sequence_with_memoryview(benchmark, uint8_view):
+    memory = uint8_view
+
+    def bench(memory=memory, payload=memoryview(PAYLOAD)):
+        memory[0:255] = payload
+
+    benchmark(bench)
+
+def test_benchmark_memory_view_set_sequence_with_array(benchmark, uint8_view):
+    memory = uint8_view
+
+    def bench(memory=memory, payload=PAYLOAD_ARRAY):
+        memory[0:255] = payload
+
+    benchmark(bench)
@@ -4,74 +4,85 @@
 # It extracts all code from the documentation example, compile them,
 # and run them as tests.
 
-import enum
+import collections
+import functools
 import inspect
+import re
 
 def pytest_generate_tests(metafunc):
     if 'doctest' in metafunc.fixturenames:
-        import wasmer
-
-        doctests = list(collect_doc_tests(wasmer))
-
         def ids(doctest):
             return str(doctest.obj)
 
-        metafunc.parametrize("doctest", doctests, ids=ids)
+        metafunc.parametrize("doctest", all_doc_tests(), ids=ids)
+
+@functools.lru_cache(maxsize=None)
+def all_doc_tests():
+    import wasmer
+
+    return tuple(collect_doc_tests(wasmer))
 
 def collect_doc_tests(root):
     for obj, doc in collect_docs(root):
+        # Most docstrings have no example at all.
+        if "```py" not in doc:
+            continue
+
         for start_line, source in parse_doc_string(doc):
             yield DocTest(obj, source, start_line)
 
 
 def collect_docs(root):
-    if hasattr(root, "__doc__") and root.__doc__ is not None:
-        yield root, root.__doc__
+    # Walk the API breadth-first, and visit each object only once: the
+    # same class or function is commonly reachable through several
+    # modules.
+    seen = set()
+    queue = collections.deque([root])
 
-    if inspect.ismodule(root) or inspect.isclass(root):
-        for name, obj in vars(root).items():
-            if name.startswith("_"):
-                continue
+    while queue:
+        obj = queue.popleft()
 
-            yield from collect_docs(obj)
+        if id(obj) in seen:
+            continue
 
+        seen.add(id(obj))
+        doc = getattr(obj, "__doc__", None)
 
-def parse_doc_string(doc):
-    state = ParserState.WAIT_SOURCE
-    start_line_idx = None
-    current = []
+        if doc is not None:
+            yield obj, doc
 
-    for line_idx, line in enumerate(doc.splitlines()):
-        if state is ParserState.WAIT_SOURCE and line.strip() == "```py":
-            state = ParserState.IN_SOURCE
-            start_line_idx = line_idx
+        if inspect.ismodule(obj) or inspect.isclass(obj):
+            for name, child in vars(obj).items():
+                if not name.startswith("_"):
+                    queue.append(child)
 
-        elif state is ParserState.IN_SOURCE and line.strip() != "```":
-            current.append(line)
 
-        elif state is ParserState.IN_SOURCE and line.strip() == "```":
-            yield start_line_idx, "\n".join(current)
+# Matches a fenced ```py block, capturing its source.
+CODE_BLOCK = re.compile(r"^[ \t]*```py[ \t]*\n(.*?)^[ \t]*```[ \t]*$", re.MULTILINE | re.DOTALL)
 
-            current = []
-            state = ParserState.WAIT_SOURCE
+def parse_doc_string(doc):
+    for block in CODE_BLOCK.finditer(doc):
+        start_line_idx = doc.count("\n", 0, block.start())
 
-class ParserState(int, enum.Enum):
-    WAIT_SOURCE = enum.auto()
-    IN_SOURCE = enum.auto()
+        yield start_line_idx, block.group(1).rstrip("\n")
 
 class DocTest:
     def __init__(self, obj, source, start_line):
         self.obj = obj
         self.source = source
         self.start_line = start_line
-
-    def exec(self):
         # make sure the line numbers between exception and  source agree
-        source = "\n" * self.start_line + self.source
+        self._padded_source = "\n" * start_line + source
+        self._code = None
 
+    def exec(self):
         try:
-            co = compile(source, filename="<doc>", mode="exec")
-            exec(co)
+            # The code object is compiled on first run only, so that
+            # syntax errors are still reported as test failures.
+            if self._code is None:
+                self._code = compile(self._padded_source, filename="<doc>", mode="exec")
+
+            exec(self._code)
 
         except Exception as cause:
             raise DocTestError(self.obj, self.source, cause) from cause
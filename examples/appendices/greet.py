@@ -1,47 +1,42 @@
 from wasmer import Store, Module, Instance
-import os
+from pathlib import Path
 
-__dir__ = os.path.dirname(os.path.realpath(__file__))
+__dir__ = Path(__file__).resolve().parent
 
 # Instantiates the module.
-module = Module(Store(), open(__dir__ + '/greet.wasm', 'rb').read())
+module = Module(Store(), (__dir__ / 'greet.wasm').read_bytes())
 instance = Instance(module)
 
+# Let's keep the exports at hand.
+exports = instance.exports
+
 # Set the subject to greet.
 subject = bytes('Wasmer 🐍', 'utf-8')
 length_of_subject = len(subject) + 1
 
 # Allocate memory for the subject, and get a pointer to it.
-input_pointer = instance.exports.allocate(length_of_subject)
+input_pointer = exports.allocate(length_of_subject)
 
-# Write the subject into the memory.
-memory = instance.exports.memory.uint8_view(input_pointer)
-memory[0:length_of_subject] = subject
-memory[length_of_subject] = 0 # C-string terminates by NULL.
+# Write the subject into the memory, in one go through the memory
+# buffer.
+memory = memoryview(exports.memory.buffer)
+memory[input_pointer:input_pointer + len(subject)] = subject
+memory[input_pointer + len(subject)] = 0 # C-string terminates by NULL.
 
 # Run the `greet` function. Give the pointer to the subject.
-output_pointer = instance.exports.greet(input_pointer)
-
-# Read the result of the `greet` function.
-memory = instance.exports.memory.uint8_view(output_pointer)
-memory_length = len(memory)
-
-output = []
-nth = 0
-
-while nth < memory_length:
-    byte = memory[nth]
-
-    if byte == 0:
-        break
-
-    output.append(byte)
-    nth += 1
+output_pointer = exports.greet(input_pointer)
 
-length_of_output = nth
+# Read the result of the `greet` function. The buffer is taken again
+# because the memory may have grown. The output is a C-string,
+# `Hello, <subject>!`, so only that many bytes plus its NULL byte are
+# copied, and the string ends at the first NULL byte.
+length_of_window = len(b'Hello, !') + len(subject) + 1
+memory = memoryview(exports.memory.buffer)
+output = bytes(memory[output_pointer:output_pointer + length_of_window])
+length_of_output = output.index(0)
 
-print(bytes(output).decode())
+print(output[:length_of_output].decode())
 
 # Deallocate the subject, and the output.
-instance.exports.deallocate(input_pointer, length_of_subject)
-instance.exports.deallocate(output_pointer, length_of_output)
+exports.deallocate(input_pointer, length_of_subject)
+exports.deallocate(output_pointer, length_of_output)
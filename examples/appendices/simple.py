@@ -1,9 +1,9 @@
 from wasmer import Store, Module, Instance
-import os
+from pathlib import Path
 
-__dir__ = os.path.dirname(os.path.realpath(__file__))
+__dir__ = Path(__file__).resolve().parent
 
-module = Module(Store(), open(__dir__ + '/simple.wasm', 'rb').read())
+module = Module(Store(), (__dir__ / 'simple.wasm').read_bytes())
 instance = Instance(module)
 
 result = instance.exports.sum(1, 2)
@@ -46,9 +46,10 @@ instance = Instance(module)
 # Let's call the `sum` function with 1 and 2.
 results = instance.exports.sum(1, 2)
 
-# But this is not always ideal. Kepp in mind that a `Function` object
-# is created everytime you call `Exports.__getattr__`. Hence the
-# following solution to store the function inside a variable.
+# Keep in mind that `Exports.__getattr__` builds the `Function`
+# object on the first access only, then returns the same cached
+# object. In a loop, it is still worth storing the function inside a
+# variable, as it saves the attribute lookup on each call.
 sum = instance.exports.sum
 
 assert isinstance(sum, Function)
@@ -62,14 +62,27 @@ assert isinstance(memory, Memory)
 
 # Next, read it. We have multiple options here. Either use the custom
 # views (`Uint8Array`, `Int8Array`, `Uint16Array` etc.), or use a more
-# idiomatic Pythonic approach with Python buffers + `bytearray`.
-reader = bytearray(memory.buffer)
+# idiomatic Pythonic approach with Python buffers + `memoryview`. A
+# `memoryview` doesn't copy the memory: only the bytes that are sliced
+# and read are copied.
+reader = memoryview(memory.buffer)
 
 # Go read. We know `Hello, World!` is 13 bytes long.
 #
 # Don't forget that we read bytes. We need to decode them!
-returned_string = reader[pointer:pointer + 13].decode()
+returned_string = bytes(reader[pointer:pointer + 13]).decode()
 
 assert returned_string == 'Hello, World!'
 
+# The buffer works with any library that speaks the Python buffer
+# protocol. For example, NumPy can view the whole memory as an array
+# without copying it, and large writes then happen in a single copy:
+#
+# ```py
+# import numpy as np
+#
+# array = np.frombuffer(memory.buffer, dtype=np.uint8)
+# array[offset:offset + width * height * 4].reshape(height, width, 4)[:] = image
+# ```
+
 # Yeah B-)!
@@ -18,11 +18,11 @@
 
 from wasmer import engine, wasi, Store, Module, ImportObject, Instance
 from wasmer_compiler_cranelift import Compiler
-import os
+from pathlib import Path
 
 # Let's get the `wasi.wasm` bytes!
-__dir__ = os.path.dirname(os.path.realpath(__file__))
-wasm_bytes = open(__dir__ + '/appendices/wasi.wasm', 'rb').read()
+__dir__ = Path(__file__).resolve().parent
+wasm_bytes = (__dir__ / 'appendices' / 'wasi.wasm').read_bytes()
 
 # Create a store.
 store = Store(engine.JIT(Compiler))
@@ -1,5 +1,4 @@
 from setuptools import setup
-from setuptools.dist import Distribution
 from os import path
 
 __dir__ = path.abspath(path.dirname(__file__))
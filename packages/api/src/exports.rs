@@ -8,12 +8,18 @@ use pyo3::{
     exceptions::PyLookupError,
     prelude::*,
 };
+use std::{cell::RefCell, collections::HashMap};
 
 /// Represents all the exports of an instance. It is built by
 /// `Instance.exports`.
 ///
 /// Exports can be of kind `Function`, `Global`, `Table`, or `Memory`.
 ///
+/// An export is built the first time it is accessed; next accesses
+/// return the same object. Still, when calling an exported function
+/// in a loop, bind it once (`sum = instance.exports.sum`) to save
+/// the attribute lookup on each iteration.
+///
 /// ## Example
 ///
 /// ```py
@@ -37,16 +43,21 @@ use pyo3::{
 /// assert isinstance(exports.glob, Global)
 /// assert isinstance(exports.tab, Table)
 /// assert isinstance(exports.mem, Memory)
+/// assert exports.func is exports.func
 /// ```
 #[pyclass(unsendable)]
 #[derive(Clone)]
 pub struct Exports {
     inner: wasmer::Exports,
+    objects: RefCell<HashMap<String, PyObject>>,
 }
 
 impl Exports {
     pub fn new(inner: wasmer::Exports) -> Self {
-        Self { inner }
+        Self {
+            inner,
+            objects: RefCell::new(HashMap::new()),
+        }
     }
 }
 
@@ -56,7 +67,11 @@ impl PyObjectProtocol for Exports {
         let gil_guard = Python::acquire_gil();
         let py = gil_guard.python();
 
-        Ok(match self.inner.get_extern(key.as_str()) {
+        if let Some(object) = self.objects.borrow().get(&key) {
+            return Ok(object.clone_ref(py));
+        }
+
+        let object = match self.inner.get_extern(key.as_str()) {
             Some(wasmer::Extern::Function(function)) => {
                 Py::new(py, Function::raw_new(function.clone()))?.to_object(py)
             }
@@ -75,7 +90,11 @@ impl PyObjectProtocol for Exports {
                     key
                 )))
             }
-        })
+        };
+
+        self.objects.borrow_mut().insert(key, object.clone_ref(py));
+
+        Ok(object)
     }
 }
 
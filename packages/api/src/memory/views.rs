@@ -51,9 +51,10 @@ macro_rules! memory_view {
 
         #[pymethods]
         impl $class_name {
-            /// Gets the number of bytes per element.
-            #[getter]
-            fn bytes_per_element(&self) -> u8 {
+            /// Gets the number of bytes per element. It is a class
+            /// attribute, so it can be read from the class itself.
+            #[classattr]
+            fn bytes_per_element() -> u8 {
                 $bytes_per_element
             }
         }
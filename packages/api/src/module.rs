@@ -1,10 +1,11 @@
 use crate::{errors::to_py_err, store::Store, types, wasmer_inner::wasmer};
 use pyo3::{
+    buffer::PyBuffer,
     exceptions::{PyRuntimeError, PyTypeError},
     prelude::*,
     types::{PyAny, PyBytes, PyList, PyString},
 };
-use std::convert::TryInto;
+use std::{convert::TryInto, slice};
 
 /// A WebAssembly module contains stateless WebAssembly code that has
 /// already been compiled and can be instantiated multiple times.
@@ -16,6 +17,13 @@ use std::convert::TryInto;
 /// `b"\0asm"`), this function will try to to convert the bytes
 /// assuming they correspond to the WebAssembly text format.
 ///
+/// Bytes can be given as `bytes`, or as any object implementing the
+/// [Python buffer protocol][buffer-protocol], like `bytearray`,
+/// `memoryview` or `mmap.mmap`. Contiguous buffers are read in place,
+/// without being copied first.
+///
+/// [buffer-protocol]: https://docs.python.org/3/c-api/buffer.html
+///
 /// ## Security
 ///
 /// Before the code is compiled, it will be validated using the store
@@ -33,6 +41,13 @@ use std::convert::TryInto;
 ///
 /// # Let's compile WebAssembly from WAT.
 /// module = Module(store, '(module)')
+///
+/// # Let's compile WebAssembly from a memory-mapped file.
+/// import mmap
+///
+/// with open('tests/tests.wasm', 'rb') as file:
+///     with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as wasm_bytes:
+///         module = Module(store, wasm_bytes)
 /// ```
 #[pyclass(unsendable)]
 #[text_signature = "(store, bytes)"]
@@ -46,6 +61,36 @@ impl Module {
     }
 }
 
+/// Calls `f` with the bytes held by `bytes`, which is either
+/// `bytes`, a WAT string, or an object implementing the buffer
+/// protocol.
+fn with_bytes<T, F>(py: Python, bytes: &PyAny, f: F) -> PyResult<T>
+where
+    F: FnOnce(&[u8]) -> T,
+{
+    if let Ok(bytes) = bytes.downcast::<PyBytes>() {
+        Ok(f(bytes.as_bytes()))
+    } else if let Ok(string) = bytes.downcast::<PyString>() {
+        Ok(f(string.to_str()?.as_bytes()))
+    } else if let Ok(buffer) = PyBuffer::<u8>::get(bytes) {
+        if buffer.is_c_contiguous() {
+            // SAFETY: The buffer is contiguous and `len_bytes` long,
+            // and the exporter keeps it alive until `buffer` is
+            // released, i.e. after `f` returns.
+            let bytes =
+                unsafe { slice::from_raw_parts(buffer.buf_ptr() as *const u8, buffer.len_bytes()) };
+
+            Ok(f(bytes))
+        } else {
+            Ok(f(&buffer.to_vec(py)?))
+        }
+    } else {
+        Err(to_py_err::<PyTypeError, _>(
+            "`Module` accepts Wasm bytes, a buffer of Wasm bytes, or a WAT string",
+        ))
+    }
+}
+
 #[pymethods]
 impl Module {
     /// Validates a new WebAssembly Module given the configuration
@@ -64,27 +109,20 @@ impl Module {
     /// ```
     #[text_signature = "(bytes)"]
     #[staticmethod]
-    fn validate(store: &Store, bytes: &PyAny) -> bool {
-        match bytes.downcast::<PyBytes>() {
-            Ok(bytes) => wasmer::Module::validate(store.inner(), bytes.as_bytes()).is_ok(),
-            _ => false,
-        }
+    fn validate(py: Python, store: &Store, bytes: &PyAny) -> bool {
+        with_bytes(py, bytes, |bytes| {
+            wasmer::Module::validate(store.inner(), bytes).is_ok()
+        })
+        .unwrap_or(false)
     }
 
     #[new]
-    fn new(store: &Store, bytes: &PyAny) -> PyResult<Self> {
+    fn new(py: Python, store: &Store, bytes: &PyAny) -> PyResult<Self> {
         let store = store.inner();
 
-        // Read the bytes as if there were real bytes or a WAT string.
-        let module = if let Ok(bytes) = bytes.downcast::<PyBytes>() {
-            wasmer::Module::new(store, bytes.as_bytes())
-        } else if let Ok(string) = bytes.downcast::<PyString>() {
-            wasmer::Module::new(store, string.to_str()?.as_bytes())
-        } else {
-            return Err(to_py_err::<PyTypeError, _>(
-                "`Module` accepts Wasm bytes or a WAT string",
-            ));
-        };
+        // Read the bytes as if there were real bytes, a buffer, or a
+        // WAT string.
+        let module = with_bytes(py, bytes, |bytes| wasmer::Module::new(store, bytes))?;
 
         Ok(Module {
             inner: module.map_err(to_py_err::<PyRuntimeError, _>)?,
@@ -0,0 +1,17 @@
+# Wasm files used by the tests. Each file is mapped in memory once and
+# shared by all the test modules, rather than being read into `bytes`
+# by each of them.
+
+import functools
+import mmap
+import os
+
+here = os.path.dirname(os.path.realpath(__file__))
+
+@functools.lru_cache(maxsize=None)
+def load(name):
+    """Returns a read-only memory map of the file `name` in the tests
+    directory."""
+
+    with open(os.path.join(here, name), 'rb') as file:
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
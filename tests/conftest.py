@@ -0,0 +1,104 @@
+# Fixtures shared by the tests.
+#
+# `compile_module` compiles each distinct Wasm or WAT source once per
+# session, and the test files build their instances from the modules
+# it returns. Set the `WASMER_TEST_CACHE` environment variable to also
+# keep the compiled modules on disk, in the pytest cache directory,
+# and to skip compilation on the next runs. When the tests run in
+# parallel with `pytest-xdist`, the processes share that cache too.
+
+from wasmer import Store, Module
+from _wasm_bytes import load
+import hashlib
+import os
+import pytest
+import wasmer
+
+# Size of the SHA-256 checksum that starts each on-disk cache entry.
+CHECKSUM_SIZE = hashlib.sha256().digest_size
+
+@pytest.fixture(scope='session')
+def store():
+    """Returns the store that shared modules are compiled with."""
+
+    return Store()
+
+@pytest.fixture(scope='session')
+def compile_module(request, store):
+    """Returns a function that compiles Wasm bytes, or WAT, into a
+    `Module`, once per session, or once for all sessions if the on-disk
+    cache is enabled."""
+
+    cache_directory = None
+
+    if os.environ.get('WASMER_TEST_CACHE'):
+        cache_directory = str(request.config.cache.makedir('wasmer'))
+
+    modules = {}
+
+    def compile_module(wasm_bytes):
+        # `Module` reads WAT from `bytes` as well as from `str`.
+        if isinstance(wasm_bytes, str):
+            wasm_bytes = wasm_bytes.encode()
+
+        # A serialized module is only valid for the same Wasmer
+        # version, engine and compiler.
+        key = hashlib.sha256(wasm_bytes)
+        key.update(
+            '{} {} {} {}'.format(
+                wasmer.__version__,
+                wasmer.__core_version__,
+                store.engine_name,
+                store.compiler_name,
+            ).encode()
+        )
+        key = key.hexdigest()
+
+        if key in modules:
+            return modules[key]
+
+        module = None
+        path = None
+
+        if cache_directory is not None:
+            path = os.path.join(cache_directory, key + '.wasmu')
+
+            if os.path.exists(path):
+                with open(path, 'rb') as file:
+                    checksum = file.read(CHECKSUM_SIZE)
+                    serialized_module = file.read()
+
+                # `Module.deserialize` trusts its input, so a damaged
+                # entry must never reach it: the entry starts with the
+                # SHA-256 of the serialized module, and is compiled
+                # again if it does not match.
+                if hashlib.sha256(serialized_module).digest() == checksum:
+                    module = Module.deserialize(store, serialized_module)
+
+        if module is None:
+            module = Module(store, wasm_bytes)
+
+            if path is not None:
+                # Write then rename, so that concurrent test processes
+                # never read a partially written module.
+                temporary_path = '{}.{}'.format(path, os.getpid())
+
+                serialized_module = module.serialize()
+
+                with open(temporary_path, 'wb') as file:
+                    file.write(hashlib.sha256(serialized_module).digest())
+                    file.write(serialized_module)
+
+                os.replace(temporary_path, path)
+
+        modules[key] = module
+
+        return module
+
+    return compile_module
+
+@pytest.fixture(scope='session')
+def module(compile_module):
+    """Returns the compiled `tests.wasm` module."""
+
+    return compile_module(load('tests.wasm'))
@@ -15,8 +15,13 @@ TEST_BYTES = """
       (i32.add (global.get $x) (i32.const 1)))))
 """
 
-def instance():
-    return Instance(Module(Store(), TEST_BYTES))
+@pytest.fixture(scope='module')
+def module(compile_module):
+    return compile_module(TEST_BYTES)
+
+@pytest.fixture
+def instance(module):
+    return Instance(module)
 
 def test_constructor():
     store = Store()
@@ -53,25 +58,25 @@ def test_constructor_mutable():
 
     assert global_.value == 153
 
-def test_export():
-    assert isinstance(instance().exports.x, Global)
+def test_export(instance):
+    assert isinstance(instance.exports.x, Global)
 
-def test_type():
-    type = instance().exports.x.type
+def test_type(instance):
+    type = instance.exports.x.type
 
     assert type.type == Type.I32
     assert type.mutable == True
     assert str(type) == 'GlobalType(type: I32, mutable: true)'
 
-def test_global_mutable():
-    exports = instance().exports
+def test_global_mutable(instance):
+    exports = instance.exports
 
     assert exports.x.mutable == True
     assert exports.y.mutable == True
     assert exports.z.mutable == False
 
-def test_global_read_write():
-    y = instance().exports.y
+def test_global_read_write(instance):
+    y = instance.exports.y
 
     assert y.value == 7
 
@@ -79,8 +84,8 @@ def test_global_read_write():
 
     assert y.value == 8
 
-def test_global_read_write_and_exported_functions():
-    exports = instance().exports
+def test_global_read_write_and_exported_functions(instance):
+    exports = instance.exports
     x = exports.x
 
     assert x.value == 0
@@ -96,8 +101,8 @@ def test_global_read_write_and_exported_functions():
     assert x.value == 2
     assert exports.get_x() == 2
 
-def test_global_read_write_constant():
-    z = instance().exports.z
+def test_global_read_write_constant(instance):
+    z = instance.exports.z
 
     assert z.value == 42
 
@@ -1,4 +1,4 @@
-from wasmer import ImportObject, Store, Module, Instance, Function, Memory, MemoryType, Global, Value
+from wasmer import ImportObject, Module, Instance, Function, Memory, MemoryType, Global, Value
 import pytest
 
 def test_constructor():
@@ -9,11 +9,10 @@ def test_contains_namespace():
 
     assert import_object.contains_namespace("foo") == False
 
-def test_import_function():
+def test_import_function(store):
     def sum(x: int, y: int) -> int:
         return x + y
 
-    store = Store()
     module = Module(
         store,
         """
@@ -38,8 +37,7 @@ def test_import_function():
 
     assert instance.exports.add_one(1) == 2
 
-def test_import_memory():
-    store = Store()
+def test_import_memory(store):
     module = Module(
         store,
         """
@@ -57,7 +55,7 @@ def test_import_memory():
     )
 
     memory = Memory(store, MemoryType(1, shared=False))
-    view = memory.uint8_view(offset=0)
+    view = memoryview(memory.buffer)
 
     import_object = ImportObject()
     import_object.register(
@@ -75,8 +73,7 @@ def test_import_memory():
     instance.exports.increment()
     assert view[0] == 2
 
-def test_import_global():
-    store = Store()
+def test_import_global(store):
     module = Module(
         store,
         """
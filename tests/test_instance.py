@@ -1,11 +1,12 @@
 import wasmer
 from wasmer import Instance, Module, Store, Exports, Function, Global, Table, Memory
-import os
 import pytest
 
-here = os.path.dirname(os.path.realpath(__file__))
-TEST_BYTES = open(here + '/tests.wasm', 'rb').read()
-INVALID_TEST_BYTES = open(here + '/invalid.wasm', 'rb').read()
+@pytest.fixture(scope='module')
+def instance(module):
+    """Returns an instance shared by the tests that only read it."""
+
+    return Instance(module)
 
 def test_version():
     assert isinstance(wasmer.__version__, str)
@@ -13,12 +14,10 @@ def test_version():
 def test_core_version():
     assert isinstance(wasmer.__core_version__, str)
 
-def test_new():
-    assert isinstance(Instance(Module(Store(), TEST_BYTES)), Instance)
-
-def test_exports():
-    instance = Instance(Module(Store(), TEST_BYTES))
+def test_new(module):
+    assert isinstance(Instance(module), Instance)
 
+def test_exports(instance):
     assert isinstance(instance.exports, Exports)
 
 def test_exports_all_kind():
@@ -41,21 +40,22 @@ def test_exports_all_kind():
     assert isinstance(exports.tab, Table)
     assert isinstance(exports.mem, Memory)
 
-def test_exports_not_clone():
-    instance = Instance(Module(Store(), TEST_BYTES))
+def test_exports_not_clone(instance):
     exports1 = instance.exports
     exports2 = instance.exports
 
     assert exports1 == exports2
 
-def test_exports_len():
-    instance = Instance(Module(Store(), TEST_BYTES))
+def test_exports_are_built_once(instance):
+    assert instance.exports.sum is instance.exports.sum
+    assert instance.exports.memory is instance.exports.memory
 
+def test_exports_len(instance):
     assert len(instance.exports) == 13
 
-def test_export_does_not_exist():
+def test_export_does_not_exist(instance):
     with pytest.raises(LookupError) as context_manager:
-        Instance(Module(Store(), TEST_BYTES)).exports.foo
+        instance.exports.foo
 
     exception = context_manager.value
     assert str(exception) == 'Export `foo` does not exist.'
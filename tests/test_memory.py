@@ -1,15 +1,11 @@
-from wasmer import Instance, Module, Store, Memory, MemoryType, Buffer, Uint8Array, Int8Array, Uint16Array, Int16Array, Uint32Array, Int32Array
+from wasmer import Instance, Store, Memory, MemoryType, Buffer, Uint8Array, Int8Array, Uint16Array, Int16Array, Uint32Array, Int32Array
 import ctypes
 import gc
-import inspect
-import os
 import pytest
 
-here = os.path.dirname(os.path.realpath(__file__))
-TEST_BYTES = open(here + '/tests.wasm', 'rb').read()
-
-def instance():
-    return Instance(Module(Store(), TEST_BYTES))
+@pytest.fixture
+def instance(module):
+    return Instance(module)
 
 def test_constructor():
     store = Store()
@@ -18,11 +14,11 @@ def test_constructor():
 
     assert memory.size == 3
 
-def test_export():
-    assert isinstance(instance().exports.memory, Memory)
+def test_export(instance):
+    assert isinstance(instance.exports.memory, Memory)
 
-def test_type():
-    type = instance().exports.memory.type
+def test_type(instance):
+    type = instance.exports.memory.type
 
     assert isinstance(type, MemoryType)
     assert type.minimum == 17
@@ -30,28 +26,28 @@ def test_type():
     assert type.shared == False
     assert str(type) == 'MemoryType(minimum: 17, maximum: None, shared: false)'
 
-def test_size():
-    assert instance().exports.memory.size == 17
+def test_size(instance):
+    assert instance.exports.memory.size == 17
 
-def test_data_size():
-    assert instance().exports.memory.data_size == 1114112
+def test_data_size(instance):
+    assert instance.exports.memory.data_size == 1114112
 
-def test_memory_buffer():
-    memory = instance().exports.memory.buffer
+def test_memory_buffer(instance):
+    memory = instance.exports.memory.buffer
     assert isinstance(memory, Buffer)
 
 def test_is_a_class():
-    assert inspect.isclass(Memory)
-    assert inspect.isclass(Uint8Array)
-    assert inspect.isclass(Int8Array)
-    assert inspect.isclass(Uint16Array)
-    assert inspect.isclass(Int16Array)
-    assert inspect.isclass(Uint32Array)
-    assert inspect.isclass(Int32Array)
-    assert inspect.isclass(Buffer)
-
-def test_bytes_per_element():
-    memory = instance().exports.memory
+    assert isinstance(Memory, type)
+    assert isinstance(Uint8Array, type)
+    assert isinstance(Int8Array, type)
+    assert isinstance(Uint16Array, type)
+    assert isinstance(Int16Array, type)
+    assert isinstance(Uint32Array, type)
+    assert isinstance(Int32Array, type)
+    assert isinstance(Buffer, type)
+
+def test_bytes_per_element(instance):
+    memory = instance.exports.memory
 
     assert memory.uint8_view().bytes_per_element ==  1
     assert memory.int8_view().bytes_per_element ==  1
@@ -60,36 +56,47 @@ def test_bytes_per_element():
     assert memory.uint32_view().bytes_per_element ==  4
     assert memory.int32_view().bytes_per_element ==  4
 
+def test_bytes_per_element_on_classes():
+    assert Uint8Array.bytes_per_element == 1
+    assert Int8Array.bytes_per_element == 1
+    assert Uint16Array.bytes_per_element == 2
+    assert Int16Array.bytes_per_element == 2
+    assert Uint32Array.bytes_per_element == 4
+    assert Int32Array.bytes_per_element == 4
+
 @pytest.mark.xfail()
 def test_cannot_construct():
     assert isinstance(Uint8Array(0), Uint8Array)
 
-def test_length():
-    assert len(instance().exports.memory.uint8_view()) == (
+def test_length(instance):
+    assert len(instance.exports.memory.uint8_view()) == (
         1114112
     )
 
-def test_get_index():
-    memory = instance().exports.memory.uint8_view()
+def test_get_index(instance):
+    memory = instance.exports.memory.uint8_view()
     index = 7
     value = 42
     memory[index] = value
 
     assert memory[index] == value
 
-def test_get_integer_out_of_range_too_large():
+def test_get_integer_out_of_range_too_large(instance):
+    memory = instance.exports.memory.uint8_view()
+    size = len(memory)
+
     with pytest.raises(IndexError) as context_manager:
-        memory = instance().exports.memory.uint8_view()
-        memory[len(memory) + 1]
+        memory[size + 1]
 
     exception = context_manager.value
     assert str(exception) == (
         'Out of bound: Maximum index 1114113 is larger than the memory size 1114112'
     )
 
-def test_get_integer_out_of_range_negative():
+def test_get_integer_out_of_range_negative(instance):
+    memory = instance.exports.memory.uint8_view()
+
     with pytest.raises(IndexError) as context_manager:
-        memory = instance().exports.memory.uint8_view()
         memory[-1]
 
     exception = context_manager.value
@@ -97,18 +104,17 @@ def test_get_integer_out_of_range_negative():
         'Out of bound: Index cannot be negative'
     )
 
-def test_get_slice():
-    memory = instance().exports.memory.uint8_view()
+def test_get_slice(instance):
+    memory = instance.exports.memory.uint8_view()
     index = 7
-    memory[index    ] = 1
-    memory[index + 1] = 2
-    memory[index + 2] = 3
+    memoryview(instance.exports.memory.buffer)[index:index + 3] = bytes([1, 2, 3])
 
     assert memory[index:index + 3] == [1, 2, 3]
 
-def test_get_slice_out_of_range_empty():
+def test_get_slice_out_of_range_empty(instance):
+    memory = instance.exports.memory.uint8_view()
+
     with pytest.raises(IndexError) as context_manager:
-        memory = instance().exports.memory.uint8_view()
         memory[2:1]
 
     exception = context_manager.value
@@ -116,9 +122,10 @@ def test_get_slice_out_of_range_empty():
         'Slice `2:1` cannot be empty'
     )
 
-def test_get_slice_out_of_range_invalid_step():
+def test_get_slice_out_of_range_invalid_step(instance):
+    memory = instance.exports.memory.uint8_view()
+
     with pytest.raises(IndexError) as context_manager:
-        memory = instance().exports.memory.uint8_view()
         memory[1:7:2]
 
     exception = context_manager.value
@@ -126,9 +133,10 @@ def test_get_slice_out_of_range_invalid_step():
         'Slice must have a step of 1 for now; given 2'
     )
 
-def test_get_invalid_index():
+def test_get_invalid_index(instance):
+    memory = instance.exports.memory.uint8_view()
+
     with pytest.raises(ValueError) as context_manager:
-        memory = instance().exports.memory.uint8_view()
         memory['a']
 
     exception = context_manager.value
@@ -136,72 +144,68 @@ def test_get_invalid_index():
         'Only integers and slices are valid to represent an index'
     )
 
-def test_set_single_value():
-    memory = instance().exports.memory.uint8_view()
+def test_set_single_value(instance):
+    memory = instance.exports.memory.uint8_view()
 
     assert memory[7] == 0
     memory[7] = 42
     assert memory[7] == 42
 
-def test_set_list():
-    memory = instance().exports.memory.uint8_view()
+def test_set_list(instance):
+    memory = instance.exports.memory.uint8_view()
 
     memory[7:12] = [1, 2, 3, 4, 5]
     assert memory[7:12] == [1, 2, 3, 4, 5]
 
-def test_set_bytes():
-    memory = instance().exports.memory.uint8_view()
+def test_set_bytes(instance):
+    memory = instance.exports.memory.uint8_view()
 
     memory[7:12] = bytes(b'abcde')
     assert memory[7:12] == [97, 98, 99, 100, 101]
 
-def test_set_bytearray():
-    memory = instance().exports.memory.uint8_view()
+def test_set_bytearray(instance):
+    memory = instance.exports.memory.uint8_view()
 
     memory[7:12] = bytearray(b'abcde')
     assert memory[7:12] == [97, 98, 99, 100, 101]
 
-def test_set_values_with_slice_and_step():
-    memory = instance().exports.memory.uint8_view()
+def test_set_values_with_slice_and_step(instance):
+    memory = instance.exports.memory.uint8_view()
 
     memory[7:12:2] = [1, 2, 3, 4, 5]
     assert memory[7:12] == [1, 0, 2, 0, 3]
 
-def test_set_out_of_range():
+def test_set_out_of_range(instance):
+    memory = instance.exports.memory.uint8_view()
+    size = len(memory)
+
     with pytest.raises(IndexError) as context_manager:
-        memory = instance().exports.memory.uint8_view()
-        memory[len(memory) + 1] = 42
+        memory[size + 1] = 42
 
     exception = context_manager.value
     assert str(exception) == (
         'Out of bound: Absolute index 1114113 is larger than the memory size 1114112'
     )
 
-def test_hello_world():
-    exports = instance().exports
+def test_hello_world(instance):
+    exports = instance.exports
     pointer = exports.string()
-    memory = exports.memory.uint8_view(pointer)
-    nth = 0
-    string = ''
-
-    while (0 != memory[nth]):
-        string += chr(memory[nth])
-        nth += 1
+    expected = 'Hello, World!'
+    # Copy the expected string plus its NULL byte only.
+    memory = bytes(memoryview(exports.memory.buffer)[pointer:pointer + len(expected) + 1])
+    string = memory[:memory.index(0)].decode()
 
-    assert string == 'Hello, World!'
+    assert string == expected
 
-def test_memory_views_share_the_same_buffer():
-    memory = instance().exports.memory
+def test_memory_views_share_the_same_buffer(instance):
+    memory = instance.exports.memory
     int8 = memory.int8_view()
     int16 = memory.int16_view()
     int32 = memory.int32_view()
 
-    int8[0] = 0b00000001
-    int8[1] = 0b00000100
-    int8[2] = 0b00010000
-    int8[3] = 0b01000000
+    memoryview(memory.buffer)[0:4] = bytes([0b00000001, 0b00000100, 0b00010000, 0b01000000])
 
-    byte_array = bytearray(memory.buffer)
+    byte_array = bytes(memoryview(memory.buffer)[0:4])
 
     assert int8[0] == 0b00000001
     assert int8[1] == 0b00000100
@@ -210,13 +214,10 @@ def test_memory_views_share_the_same_buffer():
     assert int16[0] == 0b0000010000000001
     assert int16[1] == 0b0100000000010000
     assert int32[0] == 0b01000000000100000000010000000001
-    assert byte_array[0] == 0b00000001
-    assert byte_array[1] == 0b00000100
-    assert byte_array[2] == 0b00010000
-    assert byte_array[3] == 0b01000000
+    assert byte_array == bytes([0b00000001, 0b00000100, 0b00010000, 0b01000000])
 
-def test_memory_grow():
-    memory = instance().exports.memory
+def test_memory_grow(instance):
+    memory = instance.exports.memory
     int8 = memory.int8_view()
 
     old_memory_length = len(int8)
@@ -230,17 +231,17 @@ def test_memory_grow():
     assert memory_length == 1179648
     assert memory_length - old_memory_length == 65536
 
-def test_memory_grow_too_much():
+def test_memory_grow_too_much(instance):
     with pytest.raises(RuntimeError) as context_manager:
-        instance().exports.memory.grow(100000)
+        instance.exports.memory.grow(100000)
 
     exception = context_manager.value
     assert str(exception) == (
         'The memory could not grow: current size 17 pages, requested increase: 100000 pages'
     )
 
-def test_memory_buffer_memoryview():
-    memory = instance().exports.memory
+def test_memory_buffer_memoryview(instance):
+    memory = instance.exports.memory
 
     int8 = memory.int8_view()
     int8[0] = 1
@@ -262,8 +263,8 @@ def test_memory_buffer_memoryview():
     assert memory_view.contiguous == True
     assert memory_view[0:3].tolist() == [1, 2, 3]
 
-def test_memory_buffer_bytearray():
-    memory = instance().exports.memory
+def test_memory_buffer_bytearray(instance):
+    memory = instance.exports.memory
 
     int8 = memory.int8_view()
     int8[0] = 1
@@ -282,10 +283,10 @@ def test_memory_buffer_bytearray():
     assert byte_array[0:3] == b'\x01\x02\x03'
     assert byte_array[3:9].decode() == 'Wasmer'
 
-def test_memory_buffer_supports_ctypes():
+def test_memory_buffer_supports_ctypes(instance):
     c_uint8_4 = ctypes.c_uint8 * 4
 
-    memory = instance().exports.memory
+    memory = instance.exports.memory
 
     arr = c_uint8_4.from_buffer(memory.buffer)
     arr[0] = 0b00000001
@@ -293,13 +294,13 @@ def test_memory_buffer_supports_ctypes():
     arr[2] = 0b00010000
     arr[3] = 0b01000000
 
-    byte_array = bytearray(memory.buffer)
-    assert byte_array[0] == 0b00000001
-    assert byte_array[1] == 0b00000100
-    assert byte_array[2] == 0b00010000
-    assert byte_array[3] == 0b01000000
+    view = memoryview(memory.buffer)
+    assert view[0] == 0b00000001
+    assert view[1] == 0b00000100
+    assert view[2] == 0b00010000
+    assert view[3] == 0b01000000
 
-def test_memory_buffer_supports_keeps_object_alive():
+def test_memory_buffer_supports_keeps_object_alive(module):
     """Overwrites a buffer's memory to segfault for incorrect ownership.
 
     The buffer protocol requires the buffer view to keep the owner of the
@@ -312,7 +313,9 @@ def test_memory_buffer_supports_keeps_object_alive():
     write into free'd memory. Depending on architecture, this operation will
     lead to a segfault.
     """
-    buffer = instance().exports.memory.buffer
+    # The instance is not kept by the test, so that only the buffer
+    # refers to the memory.
+    buffer = Instance(module).exports.memory.buffer
     view = memoryview(buffer)
 
     # delete the buffer and call the GC to force the buffer view held inside
@@ -320,6 +323,4 @@ def test_memory_buffer_supports_keeps_object_alive():
     del buffer
     gc.collect()
 
-    val = bytes([42] * 1024)
-    for i in range(len(view) // 1024):
-        view[i * 1024:(i + 1) * 1024] = val
+    view[:] = bytes([42]) * len(view)
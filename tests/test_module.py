@@ -1,43 +1,74 @@
 import wasmer
-from wasmer import Store, Module, ExportType, ImportType, FunctionType, MemoryType, GlobalType, TableType, Type
+from wasmer import Module, ExportType, ImportType, FunctionType, MemoryType, GlobalType, TableType, Type
+from _wasm_bytes import load
 from enum import IntEnum
-import os
+import gc
+import mmap
 import pytest
 
-here = os.path.dirname(os.path.realpath(__file__))
-TEST_BYTES = open(here + '/tests.wasm', 'rb').read()
-INVALID_TEST_BYTES = open(here + '/invalid.wasm', 'rb').read()
+@pytest.fixture(scope='module')
+def wasm_bytes():
+    # `Module` and `Module.validate` are documented to take `bytes`,
+    # so the tests get a real `bytes` copy of the shared mapping. Only
+    # the buffer tests pass other buffer objects.
+    return bytes(load('tests.wasm'))
 
-def test_validate():
-    assert Module.validate(Store(), TEST_BYTES)
+@pytest.fixture(scope='module')
+def invalid_wasm_bytes():
+    return bytes(load('invalid.wasm'))
 
-def test_validate_invalid():
-    assert not Module.validate(Store(), INVALID_TEST_BYTES)
+def test_validate(store, wasm_bytes):
+    assert Module.validate(store, wasm_bytes)
 
-def test_compile_bytes():
-    assert isinstance(Module(Store(), TEST_BYTES), Module)
+def test_validate_invalid(store, invalid_wasm_bytes):
+    assert not Module.validate(store, invalid_wasm_bytes)
 
-def test_compile_wat():
-    assert isinstance(Module(Store(), '(module)'), Module)
+def test_validate_buffer(store, wasm_bytes):
+    assert Module.validate(store, memoryview(wasm_bytes))
 
-def test_failed_to_compile():
-    with pytest.raises(RuntimeError) as context_manager:
-        Module(Store(), INVALID_TEST_BYTES)
+def test_compile_bytes(store, wasm_bytes):
+    assert isinstance(Module(store, wasm_bytes), Module)
 
-def test_name_some():
-    assert Module(Store(), '(module $moduleName)').name == 'moduleName'
+def test_compile_bytearray(store, wasm_bytes):
+    assert isinstance(Module(store, bytearray(wasm_bytes)), Module)
 
-def test_name_none():
-    assert Module(Store(), '(module)').name == None
+def test_compile_memoryview(store, wasm_bytes):
+    assert isinstance(Module(store, memoryview(wasm_bytes)), Module)
 
-def test_name_set():
-    module = Module(Store(), '(module)')
+def test_compile_mmap(store):
+    wasm_bytes = load('tests.wasm')
+
+    assert isinstance(wasm_bytes, mmap.mmap)
+    assert isinstance(Module(store, wasm_bytes), Module)
+
+def test_compile_unsupported_type(store):
+    with pytest.raises(TypeError) as context_manager:
+        Module(store, 42)
+
+    exception = context_manager.value
+    assert str(exception) == '`Module` accepts Wasm bytes, a buffer of Wasm bytes, or a WAT string'
+
+def test_compile_wat(store):
+    assert isinstance(Module(store, '(module)'), Module)
+
+def test_failed_to_compile(store, invalid_wasm_bytes):
+    with pytest.raises(RuntimeError):
+        Module(store, invalid_wasm_bytes)
+
+def test_name_some(store):
+    assert Module(store, '(module $moduleName)').name == 'moduleName'
+
+def test_name_none(store):
+    assert Module(store, '(module)').name == None
+
+def test_name_set(store):
+    module = Module(store, '(module)')
     module.name = 'hello'
     assert module.name == 'hello'
 
-def test_exports():
+def test_exports(store):
     exports = Module(
-        Store(),
+        store,
         """
         (module
           (func (export "function") (param i32 i64))
@@ -50,30 +81,34 @@ def test_exports():
     assert isinstance(exports[0], ExportType)
 
     assert exports[0].name == "function"
-    assert isinstance(exports[0].type, FunctionType)
-    assert exports[0].type.params == [Type.I32, Type.I64]
-    assert exports[0].type.results == []
+    function_type = exports[0].type
+    assert isinstance(function_type, FunctionType)
+    assert function_type.params == [Type.I32, Type.I64]
+    assert function_type.results == []
 
     assert exports[1].name == "global"
-    assert isinstance(exports[1].type, GlobalType)
-    assert exports[1].type.type == Type.I32
-    assert exports[1].type.mutable == False
+    global_type = exports[1].type
+    assert isinstance(global_type, GlobalType)
+    assert global_type.type == Type.I32
+    assert global_type.mutable == False
 
     assert exports[2].name == "table"
-    assert isinstance(exports[2].type, TableType)
-    assert exports[2].type.type == Type.FUNC_REF
-    assert exports[2].type.minimum == 0
-    assert exports[2].type.maximum == None
+    table_type = exports[2].type
+    assert isinstance(table_type, TableType)
+    assert table_type.type == Type.FUNC_REF
+    assert table_type.minimum == 0
+    assert table_type.maximum == None
 
     assert exports[3].name == "memory"
-    assert isinstance(exports[3].type, MemoryType)
-    assert exports[3].type.minimum == 1
-    assert exports[3].type.maximum == None
-    assert exports[3].type.shared == False
+    memory_type = exports[3].type
+    assert isinstance(memory_type, MemoryType)
+    assert memory_type.minimum == 1
+    assert memory_type.maximum == None
+    assert memory_type.shared == False
 
-def test_imports():
+def test_imports(store):
     imports = Module(
-        Store(),
+        store,
         """
         (module
           (import "ns" "function" (func))
@@ -87,51 +122,60 @@ def test_imports():
 
     assert imports[0].module == "ns"
     assert imports[0].name == "function"
-    assert isinstance(imports[0].type, FunctionType)
-    assert imports[0].type.params == []
-    assert imports[0].type.results == []
+    function_type = imports[0].type
+    assert isinstance(function_type, FunctionType)
+    assert function_type.params == []
+    assert function_type.results == []
 
     assert imports[1].module == "ns"
     assert imports[1].name == "global"
-    assert isinstance(imports[1].type, GlobalType)
-    assert imports[1].type.type == Type.F32
-    assert imports[1].type.mutable == False
+    global_type = imports[1].type
+    assert isinstance(global_type, GlobalType)
+    assert global_type.type == Type.F32
+    assert global_type.mutable == False
 
     assert imports[2].module == "ns"
     assert imports[2].name == "table"
-    assert isinstance(imports[2].type, TableType)
-    assert imports[2].type.type == Type.FUNC_REF
-    assert imports[2].type.minimum == 1
-    assert imports[2].type.maximum == 2
+    table_type = imports[2].type
+    assert isinstance(table_type, TableType)
+    assert table_type.type == Type.FUNC_REF
+    assert table_type.minimum == 1
+    assert table_type.maximum == 2
 
     assert imports[3].module == "ns"
     assert imports[3].name == "memory"
-    assert isinstance(imports[3].type, MemoryType)
-    assert imports[3].type.minimum == 3
-    assert imports[3].type.maximum == 4
-    assert imports[3].type.shared == False
-
-def test_custom_section():
-    module = Module(Store(), open(here + '/custom_sections.wasm', 'rb').read())
+    memory_type = imports[3].type
+    assert isinstance(memory_type, MemoryType)
+    assert memory_type.minimum == 3
+    assert memory_type.maximum == 4
+    assert memory_type.shared == False
+
+def test_custom_section(store):
+    module = Module(store, load('custom_sections.wasm'))
     assert module.custom_sections('easter_egg') == [b'Wasmer']
     assert module.custom_sections('hello') == [b'World!']
     assert module.custom_sections('foo') == []
 
-def test_serialize():
-    assert type(Module(Store(), "(module)").serialize()) == bytes
-
-def test_deserialize():
-    store = Store()
-
-    serialized_module = Module(
-        store,
+@pytest.fixture(scope='module')
+def serialized_module(compile_module):
+    return compile_module(
         """
         (module
           (func (export "function") (param i32 i64)))
         """
     ).serialize()
-    module = Module.deserialize(store, serialized_module)
-    del serialized_module
+
+def test_serialize(serialized_module):
+    assert type(serialized_module) == bytes
+
+def test_deserialize(store, serialized_module):
+    # Deserialize a private copy, and drop it before using the module,
+    # so that the module cannot rely on the serialized bytes being
+    # kept alive. `bytes(...)` alone would return the same object.
+    blob = bytes(bytearray(serialized_module))
+    module = Module.deserialize(store, blob)
+    del blob
+    gc.collect()
 
     exports = module.exports
 
@@ -1,12 +1,8 @@
 from wasmer import engine, Store, Module, Instance
 import itertools
-import os
 import platform
 import pytest
 
-here = os.path.dirname(os.path.realpath(__file__))
-TEST_BYTES = open(here + '/tests.wasm', 'rb').read()
-
 def test_store_defaults():
     store = Store()
 
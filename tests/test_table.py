@@ -1,4 +1,4 @@
-from wasmer import Instance, Module, Store, Table, TableType, Type
+from wasmer import Instance, Table, TableType, Type
 import pytest
 
 TEST_BYTES = """
@@ -6,19 +6,22 @@ TEST_BYTES = """
   (table (export "table") 0 funcref))
 """
 
-def instance():
-    return Instance(Module(Store(), TEST_BYTES))
+@pytest.fixture(scope='module')
+def instance(compile_module):
+    # The table is empty and never written to, so one instance serves
+    # all the tests of this file.
+    return Instance(compile_module(TEST_BYTES))
 
-def test_export():
-    assert isinstance(instance().exports.table, Table)
+def test_export(instance):
+    assert isinstance(instance.exports.table, Table)
 
-def test_type():
-    type = instance().exports.table.type
+def test_type(instance):
+    type = instance.exports.table.type
 
     assert type.type == Type.FUNC_REF
     assert type.minimum == 0
     assert type.maximum == None
     assert str(type) == 'TableType(type: FuncRef, minimum: 0, maximum: None)'
 
-def test_size():
-    assert instance().exports.table.size == 0
+def test_size(instance):
+    assert instance.exports.table.size == 0
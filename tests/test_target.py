@@ -1,5 +1,4 @@
 from wasmer import engine, target, Store, Module
-from wasmer_compiler_cranelift import Compiler
 import itertools
 import os
 import platform
@@ -45,6 +44,8 @@ def test_target_with_default_cpu_features():
 
 @pytest.mark.skip(reason = 'CI does not have `gcc` or `clang` installed for the moment. It will be resolved once LLVM is installed.')
 def test_cross_compilation_roundtrip():
+    from wasmer_compiler_cranelift import Compiler
+
     triple = target.Triple('x86_64-linux-musl')
     cpu_features = target.CpuFeatures()
     cpu_features.add('sse2')
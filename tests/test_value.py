@@ -1,9 +1,8 @@
 from wasmer import Value
-import inspect
 import pytest
 
 def test_is_a_class():
-    assert inspect.isclass(Value)
+    assert isinstance(Value, type)
 
 @pytest.mark.xfail()
 def test_cannot_construct():
@@ -1,4 +1,4 @@
-from wasmer import wat2wasm, wasm2wat, Instance, Module, Store
+from wasmer import wat2wasm, wasm2wat, Instance, Module
 
 def test_wat2wasm():
     assert wat2wasm('(module)') == b'\x00asm\x01\x00\x00\x00'
@@ -6,7 +6,7 @@ def test_wat2wasm():
 def test_wasm2wat():
     assert wasm2wat(b'\x00asm\x01\x00\x00\x00') == '(module)'
 
-def test_wat2wasm2instance():
+def test_wat2wasm2instance(store):
     wat = """ (module
                 (type (func (param i32 i32) (result i32)))
                 (func (type 0)
@@ -15,6 +15,6 @@ def test_wat2wasm2instance():
                   i32.add)
                 (export "sum" (func 0))) """
     wasm_bytes = wat2wasm(wat)
-    instance = Instance(Module(Store(), wasm_bytes))
+    instance = Instance(Module(store, wasm_bytes))
 
     assert instance.exports.sum(1, 2) == 3